@@ -0,0 +1,127 @@
+"""Run the `tclg` benchmark suite, optionally saving a JSON report or comparing against one.
+
+Every ``benchmarks/bench_*.py`` module contributes cases, either as module-level
+``bench_*`` functions or, for cases that need files on disk, through a
+``collect(workdir)`` function that is given its own temporary directory and returns a
+`dict` of case names to cases. A case is either a function or a ``(setup, function)``
+pair, where ``setup`` is called (untimed) before every call of the function. Each case
+is timed with `timeit`, keeping the best of several repeats.
+
+Usage:
+    python -m benchmarks [-k SUBSTRING] [--output REPORT.json]
+    python -m benchmarks --compare BASELINE.json [--threshold 0.10]
+
+With ``--compare``, exits with status 1 if any case is slower than its baseline by more
+than the threshold (a fraction, e.g. 0.10 for 10%).
+"""
+import argparse
+import json
+import platform
+import sys
+import tempfile
+
+from collections.abc import Callable
+from importlib import import_module
+from pathlib import Path
+from pkgutil import iter_modules
+from timeit import Timer
+from typing import Union
+
+
+# cases with a setup time single calls, so they are repeated this many times more
+SETUP_REPEAT_FACTOR = 20
+
+Case = Union[Callable[[], object], tuple[Callable[[], object], Callable[[], object]]]
+
+
+def collect(workdir: Path, keyword: str = None) -> dict[str, Case]:
+    cases = {}
+    for info in iter_modules([str(Path(__file__).parent)]):
+        if not info.name.startswith("bench_"):
+            continue
+        module = import_module(f"{__package__}.{info.name}")
+        prefix = info.name.removeprefix("bench_")
+        if hasattr(module, "collect"):
+            moddir = workdir / prefix
+            moddir.mkdir()
+            found = module.collect(moddir)
+        else:
+            found = {
+                name.removeprefix("bench_"): func
+                for name, func in vars(module).items()
+                if name.startswith("bench_") and callable(func)
+            }
+        for name, case in found.items():
+            name = f"{prefix}.{name}"
+            if keyword is None or keyword in name:
+                cases[name] = case
+    return cases
+
+
+def measure(case: Case, repeat: int) -> dict[str, float]:
+    if isinstance(case, tuple):
+        # `timeit` runs the setup once per repeat, so time a single call per repeat.
+        setup, func = case
+        timer = Timer(func, setup)
+        number = 1
+        times = timer.repeat(repeat=repeat * SETUP_REPEAT_FACTOR, number=number)
+    else:
+        timer = Timer(case)
+        number, _ = timer.autorange()
+        times = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    return {"best_s": min(times), "mean_s": sum(times) / len(times), "number": number}
+
+
+def compare(results: dict, baseline: dict, threshold: float, keyword: str = None) -> bool:
+    regressed = False
+    for name in sorted(baseline.keys() - results.keys()):
+        # cases deselected by the keyword are expected to be missing
+        if keyword is None or keyword in name:
+            print(f"{name:<48} {'MISSING':>12}")
+            regressed = True
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<48} {'(new)':>12}")
+            continue
+        ratio = result["best_s"] / base["best_s"]
+        status = "REGRESSED" if ratio > 1 + threshold else ""
+        regressed |= bool(status)
+        print(f"{name:<48} {ratio:>11.2f}x {status}")
+    return regressed
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[0])
+    parser.add_argument("-k", dest="keyword", help="only run cases whose names contain this substring")
+    parser.add_argument("--repeat", type=int, default=5, help="timing repeats per case; the best is kept")
+    parser.add_argument("--output", type=Path, help="write the JSON report to this path")
+    parser.add_argument("--compare", type=Path, help="JSON report to compare the results against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown as a fraction")
+    args = parser.parse_args(argv)
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="tclg-bench-") as workdir:
+        for name, case in collect(Path(workdir), args.keyword).items():
+            result = results[name] = measure(case, args.repeat)
+            print(f"{name:<48} {result['best_s'] * 1e6:>12.2f} us")
+
+    report = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text())
+        print(f"\ncompared to {args.compare} (threshold {args.threshold:.0%}):")
+        if compare(results, baseline["results"], args.threshold, args.keyword):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
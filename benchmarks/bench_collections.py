@@ -0,0 +1,50 @@
+"""Benchmarks of attribute and item access through the `tclg.collections` views and `tclg.operator` setters."""
+from types import SimpleNamespace
+
+from tclg.collections import AttrsItemsView, ItemsAttrsView, MutableAttrsItemsView, MutableItemsAttrsView
+from tclg.operator import attrsetter, itemsetter
+
+
+DATA = {f"key{i}": i for i in range(100)}
+
+attrs_items = AttrsItemsView(DATA)
+mutable_attrs_items = MutableAttrsItemsView(dict(DATA))
+items_attrs = ItemsAttrsView(SimpleNamespace(**DATA))
+mutable_items_attrs = MutableItemsAttrsView(SimpleNamespace(**DATA))
+namespace = SimpleNamespace(**DATA)
+mapping = dict(DATA)
+
+set_attr = attrsetter("key50", 0)
+set_item = itemsetter("key50", 0)
+
+
+def bench_getattr_dict_baseline() -> None:
+    mapping["key50"]
+
+
+def bench_getattr_attrs_items_view() -> None:
+    attrs_items.key50
+
+
+def bench_setattr_mutable_attrs_items_view() -> None:
+    mutable_attrs_items.key50 = 0
+
+
+def bench_getitem_items_attrs_view() -> None:
+    items_attrs["key50"]
+
+
+def bench_setitem_mutable_items_attrs_view() -> None:
+    mutable_items_attrs["key50"] = 0
+
+
+def bench_iter_items_attrs_view() -> None:
+    list(items_attrs)
+
+
+def bench_attrsetter() -> None:
+    set_attr(namespace)
+
+
+def bench_itemsetter() -> None:
+    set_item(mapping)
@@ -0,0 +1,104 @@
+"""Microbenchmarks of the early-exit control flow in `tclg.contextlib` against flag-based loops.
+
+Each `breakable` or `exitable` case is paired with a ``*_flag`` case that implements the
+same control flow with a native ``break`` and a flag.
+
+Run with ``python -m benchmarks.bench_contextlib``.
+"""
+from timeit import repeat
+
+from tclg.contextlib import breakable, catch, exitable
+
+
+# every other row contains the target cell 50
+ROWS = [list(range(100)) if i % 2 else list(range(50)) for i in range(100)]
+
+
+def bench_inner_break_flag() -> int:
+    found = 0
+    for row in ROWS:
+        for cell in row:
+            if cell == 50:
+                found += 1
+                break
+    return found
+
+
+def bench_inner_break_breakable() -> int:
+    found = 0
+    for row in ROWS:
+        for cell in (cells := breakable(row)):
+            with cells:
+                if cell == 50:
+                    found += 1
+                    cells.break_()
+    return found
+
+
+def bench_outer_continue_flag() -> int:
+    completed = 0
+    for row in ROWS:
+        skip = False
+        for cell in row:
+            if cell == 50:
+                skip = True
+                break
+        if skip:
+            continue
+        completed += 1
+    return completed
+
+
+def bench_outer_continue_breakable() -> int:
+    completed = 0
+    for row in (rows := breakable(ROWS)):
+        with rows:
+            for cell in row:
+                if cell == 50:
+                    rows.continue_()
+            completed += 1
+    return completed
+
+
+def bench_multilevel_exit_flag() -> int:
+    exited = 0
+    for row in ROWS:
+        done = False
+        for _ in range(2):
+            for cell in row:
+                if cell == 50:
+                    done = True
+                    break
+            if done:
+                break
+        exited += done
+    return exited
+
+
+def bench_multilevel_exit_exitable() -> int:
+    exited = 0
+    for row in ROWS:
+        with exitable() as block:
+            for _ in range(2):
+                for cell in row:
+                    if cell == 50:
+                        exited += 1
+                        block.exit()
+    return exited
+
+
+def bench_catch() -> None:
+    for row in ROWS:
+        with catch(KeyError, IndexError, ValueError):
+            row[100]
+
+
+def main() -> None:
+    for name, func in globals().items():
+        if name.startswith("bench_"):
+            best = min(repeat(func, number=100, repeat=5)) / 100
+            print(f"{name:<32} {best * 1e6:>10.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Benchmarks of `tclg.io` across file sizes and input types."""
+from collections.abc import Callable
+from io import BytesIO, StringIO
+from pathlib import Path
+
+from tclg.io import append, read, read_delimited, read_jsonl, readlines, write, write_jsonl
+
+
+SIZES = {"1KiB": 1 << 10, "64KiB": 1 << 16, "4MiB": 1 << 22}
+
+LINE = "lorem ipsum dolor sit amet, consectetur adipiscing elit\n"
+
+
+def _text(size: int) -> str:
+    return (LINE * (size // len(LINE) + 1))[:size]
+
+
+def collect(workdir: Path) -> dict[str, Callable[[], object]]:
+    cases = {}
+    for label, size in SIZES.items():
+        text = _text(size)
+        data = text.encode()
+        path = workdir / f"{label}.txt"
+        path.write_text(text)
+        string = str(path)
+        buffer = BytesIO(data)
+        stream = StringIO(text)
+        appended = workdir / f"{label}.append"
+
+        def read_bytesio(buffer=buffer):
+            buffer.seek(0)
+            return read(buffer)
+
+        def read_stringio(stream=stream):
+            stream.seek(0)
+            return read(stream)
+
+        def read_binary_file(path=path):
+            with open(path, "rb") as f:
+                return read(f)
+
+        def readlines_text_file(path=path):
+            with open(path, "rt") as f:
+                return readlines(f)
+
+        def append_str(appended=appended, text=text):
+            appended.unlink(missing_ok=True)
+            return append(appended, text)
+
+        def append_bytes(appended=appended, data=data):
+            appended.unlink(missing_ok=True)
+            return append(appended, data)
+
+        cases.update({
+            f"read.str.{label}": lambda string=string: read(string),
+            f"read.path.{label}": lambda path=path: read(path),
+            f"read.bytesio.{label}": read_bytesio,
+            f"read.stringio.{label}": read_stringio,
+            f"read.binary_file.{label}": read_binary_file,
+            f"write.str.{label}": lambda path=workdir / f"{label}.str", text=text: write(path, text),
+            f"write.bytes.{label}": lambda path=workdir / f"{label}.bytes", data=data: write(path, data),
+            f"write.bytesio.{label}": lambda data=data: write(BytesIO(), data),
+            f"append.str.{label}": append_str,
+            f"append.bytes.{label}": append_bytes,
+            f"readlines.str.{label}": lambda string=string: readlines(string),
+            f"readlines.path.{label}": lambda path=path: readlines(path),
+            f"readlines.text_file.{label}": readlines_text_file,
+        })
+
+        records = [{"id": i, "line": LINE, "tags": ["a", "b"]} for i in range(size // 64)]
+        jsonl = workdir / f"{label}.jsonl"
+        write_jsonl(jsonl, records)
+        csv = workdir / f"{label}.csv"
+        csv.write_text("".join(f"{i},{LINE.strip()},{i * 2}\n" for i in range(size // 64)))
+        cases.update({
+            f"write_jsonl.{label}": lambda path=workdir / f"{label}.out.jsonl", records=records: write_jsonl(path, records),
+            f"read_jsonl.{label}": lambda path=jsonl: list(read_jsonl(path)),
+            f"read_jsonl.fields.{label}": lambda path=jsonl: list(read_jsonl(path, fields=["id"])),
+            f"read_delimited.{label}": lambda path=csv: list(read_delimited(path)),
+            f"read_delimited.fields.{label}": lambda path=csv: list(read_delimited(path, fields=[0])),
+        })
+    return cases
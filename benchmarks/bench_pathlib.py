@@ -0,0 +1,38 @@
+"""Benchmarks of `tclg.pathlib` on generated directory trees."""
+import os
+
+from collections.abc import Callable
+from pathlib import Path
+from typing import Union
+
+from tclg.pathlib import glob, lsdir, rglob, rmdirs
+
+
+# tree name -> (directories per level, levels, files per directory)
+TREES = {"flat": (1, 1, 1000), "wide": (20, 2, 10), "deep": (2, 8, 2)}
+
+
+def _mktree(root: Path, breadth: int, depth: int, files: int) -> None:
+    root.mkdir()
+    for i in range(files):
+        (root / f"file{i}.txt").touch()
+    if depth > 1:
+        for i in range(breadth):
+            _mktree(root / f"dir{i}", breadth, depth - 1, files)
+
+
+def collect(workdir: Path) -> dict[str, Union[Callable, tuple[Callable, Callable]]]:
+    cases = {}
+    for name, (breadth, depth, files) in TREES.items():
+        root = workdir / name
+        _mktree(root, breadth, depth, files)
+        cases.update({
+            f"lsdir.{name}": lambda root=root: lsdir(root),
+            f"glob.{name}": lambda root=root: glob("*/*.txt", root),
+            f"rglob.{name}": lambda root=root: list(rglob("*.txt", root)),
+        })
+
+    chain = workdir / "chain"
+    leaf = chain.joinpath(*(f"d{i}" for i in range(16)))
+    cases["rmdirs.depth16"] = (lambda: os.makedirs(leaf), lambda: rmdirs(leaf))
+    return cases
@@ -0,0 +1,25 @@
+"""Utilities, helpers, sugar, etc. for Travis C. LaGrone.
+
+Submodules are imported lazily on first attribute access (see PEP 562), so that
+``import tclg`` alone costs next to nothing and e.g. ``tclg.io`` imports only what
+`tclg.io` itself needs.
+"""
+
+__all__ = [
+    "collections",
+    "contextlib",
+    "functools",
+    "io",
+    "operator",
+    "pathlib",
+    "typing",
+]
+__dir__ = lambda: __all__
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        from importlib import import_module
+
+        return import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -30,7 +30,7 @@ class AttrsItemsView(Generic[V]):
     def __init__(self, data: Mapping[str, V]):
         if not isinstance(data, Mapping):
             raise TypeError(f"Expected data to be a Mapping, not a {type(data)}")
-        self._data = data
+        object.__setattr__(self, "_data", data)
 
     def __dir__(self) -> Sequence[str]:
         return tuple(filter(is_public, self._data.keys()))
@@ -54,7 +54,7 @@ class MutableAttrsItemsView(AttrsItemsView):
     def __init__(self, data: MutableMapping[str, V]):
         if not isinstance(data, MutableMapping):
             raise TypeError(f"Expected data to be a MutableMapping, not a {type(data)}")
-        self._data = data
+        object.__setattr__(self, "_data", data)
 
     def __setattr__(self, name: str, value: V) -> None:
         if not is_public(name):
@@ -1,5 +1,9 @@
-from collections.abc import Sequence
-from typing import NoReturn, Optional
+from collections.abc import Callable, Iterable
+import sys
+from contextvars import ContextVar
+from functools import wraps
+from time import perf_counter_ns
+from typing import Any, NoReturn, Optional, ParamSpec, TypeVar
 
 
 __all__ = []
@@ -11,6 +15,22 @@ def _export(definition):
     return definition
 
 
+P = ParamSpec("P")
+R = TypeVar("R")
+T = TypeVar("T")
+
+
+class _ControlFlow(BaseException):
+    """Preallocated signal used to unwind to a specific context manager.
+
+    Instances are raised without a traceback (see `BaseException.with_traceback`) and have
+    their traceback and context cleared when caught, so raising one repeatedly does not
+    accumulate traceback entries or keep frames (or exceptions being handled) alive.
+    """
+
+    __slots__ = ()
+
+
 @_export
 class exitable:
     """Context manager that provides a method to unexceptionally exit the block early.
@@ -58,20 +78,81 @@ class exitable:
         ...             return x
     """
 
-    class __ContextExit(BaseException):
-        pass
-
     def __init__(self):
-        self.__exit_exc = self.__ContextExit()
+        self.__exit_exc = _ControlFlow()
 
     def __enter__(self) -> "exitable":
         return self
 
     def __exit__(self, exc_type, exc_value, traceback) -> bool:
-        return exc_value is None or exc_value is self.__exit_exc
+        if exc_value is None:
+            return True
+        if exc_value is self.__exit_exc:
+            exc_value.__traceback__ = exc_value.__context__ = None
+            return True
+        return False
 
     def exit(self) -> NoReturn:
-        raise self.__exit_exc from None
+        raise self.__exit_exc.with_traceback(None) from None
+
+
+@_export
+class breakable:
+    """Iterator wrapper that provides methods to break or continue its loop from within nested loops.
+
+    Each iteration of the loop must run its body inside the `breakable` as a context
+    manager, which catches the `break_` and `continue_` signals meant for that loop and
+    lets any others propagate to the enclosing loops. Like `exitable`, the signals are
+    preallocated and raised without a traceback, so they are cheap to use in tight loops.
+
+    This iterator is NOT reentrant.
+
+    Example:
+        >>> for row in (rows := breakable(table)):
+        ...     with rows:
+        ...         for cell in (cells := breakable(row)):
+        ...             with cells:
+        ...                 if cell is None:
+        ...                     rows.continue_()  # skip to the next row
+        ...                 if cell == "EOF":
+        ...                     rows.break_()  # stop reading rows
+        ...                 process(cell)
+    """
+
+    def __init__(self, iterable: Iterable[T]):
+        self.__iterator = iter(iterable)
+        self.__break_exc = _ControlFlow()
+        self.__continue_exc = _ControlFlow()
+        self.__broken = False
+
+    def __iter__(self) -> "breakable":
+        return self
+
+    def __next__(self) -> T:
+        if self.__broken:
+            raise StopIteration
+        return next(self.__iterator)
+
+    def __enter__(self) -> "breakable":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        if exc_value is None:
+            return False
+        if exc_value is self.__continue_exc:
+            exc_value.__traceback__ = exc_value.__context__ = None
+            return True
+        if exc_value is self.__break_exc:
+            exc_value.__traceback__ = exc_value.__context__ = None
+            self.__broken = True
+            return True
+        return False
+
+    def break_(self) -> NoReturn:
+        raise self.__break_exc.with_traceback(None) from None
+
+    def continue_(self) -> NoReturn:
+        raise self.__continue_exc.with_traceback(None) from None
 
 
 @_export
@@ -99,11 +180,11 @@ class catch:
         ...             return x
     """
 
-    types: Sequence[type]
-    value: Optional[Exception]
+    types: tuple[type[BaseException], ...]
+    value: Optional[BaseException]
 
-    def __init__(self, *exc_types):
-        assert all(isinstance(t, Exception) for t in exc_types)
+    def __init__(self, *exc_types: type[BaseException]):
+        assert all(isinstance(t, type) and issubclass(t, BaseException) for t in exc_types)
         self.types = exc_types
         self.value = None
 
@@ -113,10 +194,272 @@ class catch:
     def __exit__(self, exc_type, exc_value, traceback) -> bool:
         if exc_value is None:
             return True
-        if any(isinstance(exc_value, t) for t in self.types):
+        if isinstance(exc_value, self.types):
             self.value = exc_value
             return True
         return False
 
     def __bool__(self) -> bool:
         return self.value is not None
+
+
+# Per-thread recording state, created by `_timed_init` on the first `timed.enable`, so
+# that importing this module does not import `threading` or `weakref`.
+_timed_lock = None
+_timed_local = None
+
+# histograms of live threads, keyed by a weak reference to each thread's sentinel
+_timed_registry: dict[Any, dict[str, list[int]]] = {}
+
+# histograms of exited threads, merged
+_timed_retired: dict[str, list[int]] = {}
+
+# Open spans of the current context as a tuple of `(timed, path, start_ns)` entries. A
+# context variable rather than a thread-local, so that spans entered in interleaved
+# asyncio tasks do not nest in one another.
+_timed_spans: ContextVar[tuple] = ContextVar("_timed_spans", default=())
+
+# Histogram layout: [count, sum_ns, min_ns, max_ns, *buckets], where bucket `b` counts
+# spans whose duration `d` in nanoseconds has `d.bit_length() == b`, i.e. `d < 2**b`.
+_COUNT, _SUM, _MIN, _MAX, _BUCKETS = 0, 1, 2, 3, 4
+
+
+def _merge_histograms(total: dict[str, list[int]], histograms: dict[str, list[int]]) -> None:
+    for path, histogram in list(histograms.items()):
+        merged = total.get(path)
+        if merged is None:
+            total[path] = list(histogram)
+            continue
+        merged[_COUNT] += histogram[_COUNT]
+        merged[_SUM] += histogram[_SUM]
+        merged[_MIN] = min(merged[_MIN], histogram[_MIN])
+        merged[_MAX] = max(merged[_MAX], histogram[_MAX])
+        for i in range(_BUCKETS, len(merged)):
+            merged[i] += histogram[i]
+
+
+def _retire_thread(sentinel, is_finalizing=sys.is_finalizing) -> None:
+    # Threads still alive at shutdown may exit after this module's globals are cleared.
+    if is_finalizing():
+        return
+    with _timed_lock:
+        histograms = _timed_registry.pop(sentinel, None)
+        if histograms:
+            _merge_histograms(_timed_retired, histograms)
+
+
+class _TimedSentinel:
+    __slots__ = ("__weakref__",)
+
+
+def _timed_init() -> None:
+    global _timed_lock, _timed_local
+    if _timed_local is not None:
+        return
+
+    from threading import RLock, local
+    from weakref import ref
+
+    class _TimedLocal(local):
+        def __init__(self):
+            self.calls = {}
+            self.histograms = {}
+            # Released along with the rest of this thread's state when the thread exits.
+            self.sentinel = _TimedSentinel()
+            with _timed_lock:
+                _timed_registry[ref(self.sentinel, _retire_thread)] = self.histograms
+
+    _timed_lock = RLock()
+    _timed_local = _TimedLocal()
+
+
+def _timed_record(path: str, elapsed: int) -> None:
+    histograms = _timed_local.histograms
+    histogram = histograms.get(path)
+    if histogram is None:
+        histogram = histograms[path] = [0, 0, elapsed, elapsed] + [0] * 65
+    histogram[_COUNT] += 1
+    histogram[_SUM] += elapsed
+    if elapsed < histogram[_MIN]:
+        histogram[_MIN] = elapsed
+    if elapsed > histogram[_MAX]:
+        histogram[_MAX] = elapsed
+    histogram[_BUCKETS + elapsed.bit_length()] += 1
+
+
+def _prometheus_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+@_export
+class timed:
+    """Context manager and decorator that records the wall time of a block into a histogram.
+
+    Spans are recorded with `time.perf_counter_ns` into a process-wide registry of log2
+    histograms keyed by span path. Nested spans are keyed by the ``/``-joined names of
+    all enclosing spans in the same context (see `contextvars`, e.g. thread or asyncio
+    task), e.g. ``"job/tclg.io.read"``, except that a span directly nested in the same
+    `timed` instance (e.g. a decorated recursive function) shares its parent's path.
+    Each thread records into its own histograms, so recording takes no locks; histograms
+    are merged across threads on export and when a thread exits.
+
+    Timing is disabled by default, in which case entering a span costs a flag check and
+    a context variable lookup. Call `timed.enable` to start recording and `timed.disable`
+    to stop. When sampling, every n-th entry of each span path on each thread is recorded.
+
+    This context manager is reentrant and thread-safe, so a single instance may be used
+    as a decorator on recursive or concurrently called functions. Exiting a span closes
+    the innermost open span of the same instance, even if spans opened since (e.g. in a
+    suspended generator) are still open.
+
+    Example:
+        >>> timed.enable(rate=0.1)
+        >>> @timed("load")
+        ... def load(path):
+        ...     with timed("parse"):
+        ...         ...
+        >>> print(timed.to_prometheus())
+    """
+
+    _enabled: bool = False
+    _period: int = 1
+
+    name: str
+
+    def __init__(self, name: str):
+        self.name = name
+
+    @classmethod
+    def enable(cls, rate: float = 1.0) -> None:
+        """Start recording spans, sampling approximately `rate` of the entries of each span."""
+        if not 0.0 < rate <= 1.0:
+            raise ValueError(f"Expected rate to be in (0, 1], not {rate}")
+        _timed_init()
+        cls._period = max(1, round(1.0 / rate))
+        cls._enabled = True
+
+    @classmethod
+    def disable(cls) -> None:
+        """Stop recording spans. Already recorded spans are kept."""
+        cls._enabled = False
+
+    @staticmethod
+    def reset() -> None:
+        """Discard all recorded spans."""
+        if _timed_lock is None:
+            return
+        with _timed_lock:
+            _timed_retired.clear()
+            for histograms in _timed_registry.values():
+                histograms.clear()
+
+    def _start(self) -> Optional[tuple]:
+        spans = _timed_spans.get()
+        if not timed._enabled:
+            if not spans:
+                return None
+            # Mark the entry anyway, so that its exit cannot pop an enclosing entry of self.
+            entry = (self, spans[-1][1], None)
+        else:
+            if not spans:
+                path = self.name
+            elif spans[-1][0] is self:
+                path = spans[-1][1]
+            else:
+                path = f"{spans[-1][1]}/{self.name}"
+            calls = _timed_local.calls
+            n = calls[path] = calls.get(path, 0) + 1
+            entry = (self, path, perf_counter_ns() if n % timed._period == 0 else None)
+        _timed_spans.set(spans + (entry,))
+        return entry
+
+    def _stop(self, entry: Optional[tuple]) -> None:
+        if entry is None:
+            return
+        spans = _timed_spans.get()
+        for i in range(len(spans) - 1, -1, -1):
+            if spans[i] is entry:
+                _timed_spans.set(spans[:i] + spans[i + 1:])
+                break
+        _, path, start = entry
+        if start is not None:
+            _timed_record(path, perf_counter_ns() - start)
+
+    def __enter__(self) -> "timed":
+        if timed._enabled or _timed_spans.get():
+            self._start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        spans = _timed_spans.get()
+        if not spans:
+            return False
+        for i in range(len(spans) - 1, -1, -1):
+            if spans[i][0] is self:
+                self._stop(spans[i])
+                break
+        return False
+
+    def __call__(self, func: Callable[P, R]) -> Callable[P, R]:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not timed._enabled:
+                return func(*args, **kwargs)
+            entry = self._start()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._stop(entry)
+
+        return wrapper
+
+    @staticmethod
+    def snapshot() -> dict[str, dict[str, Any]]:
+        """Return the recorded spans merged across threads, keyed by span path.
+
+        Each span is a `dict` of ``count``, ``sum_ns``, ``min_ns``, ``max_ns``, and
+        ``buckets``, the last of which maps each bucket's exclusive upper bound in
+        nanoseconds to its (non-cumulative) count of spans.
+        """
+        merged: dict[str, list[int]] = {}
+        if _timed_lock is None:
+            return {}
+        with _timed_lock:
+            _merge_histograms(merged, _timed_retired)
+            for histograms in list(_timed_registry.values()):
+                _merge_histograms(merged, histograms)
+
+        return {
+            path: {
+                "count": histogram[_COUNT],
+                "sum_ns": histogram[_SUM],
+                "min_ns": histogram[_MIN],
+                "max_ns": histogram[_MAX],
+                "buckets": {
+                    2 ** b: n for b, n in enumerate(histogram[_BUCKETS:]) if n
+                },
+            }
+            for path, histogram in sorted(merged.items())
+        }
+
+    @staticmethod
+    def to_json(**kwargs) -> str:
+        """Return `timed.snapshot` encoded as JSON. Keyword arguments are passed to `json.dumps`."""
+        import json
+
+        return json.dumps(timed.snapshot(), **kwargs)
+
+    @staticmethod
+    def to_prometheus(metric: str = "tclg_timed_seconds") -> str:
+        """Return `timed.snapshot` in the Prometheus text exposition format as a histogram."""
+        lines = [f"# TYPE {metric} histogram"]
+        for path, span in timed.snapshot().items():
+            label = _prometheus_label(path)
+            cumulative = 0
+            for bound, n in span["buckets"].items():
+                cumulative += n
+                lines.append(f'{metric}_bucket{{span="{label}",le="{bound / 1e9!r}"}} {cumulative}')
+            lines.append(f'{metric}_bucket{{span="{label}",le="+Inf"}} {span["count"]}')
+            lines.append(f'{metric}_sum{{span="{label}"}} {span["sum_ns"] / 1e9!r}')
+            lines.append(f'{metric}_count{{span="{label}"}} {span["count"]}')
+        return "\n".join(lines) + "\n"
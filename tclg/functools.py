@@ -1,5 +1,11 @@
-from collections.abc import Callable
+import os
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+from time import perf_counter_ns
 from types import FunctionType
+from typing import Optional, TypeVar
 
 
 __all__ = []
@@ -33,3 +39,113 @@ def owner(cls: type) -> Callable[[FunctionType], None]:
         setattr(cls, name, func)
 
     return setowner
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_TARGET_CHUNK_NS = 20_000_000
+_MAX_CHUNKSIZE = 65_536
+
+
+def _apply(func: Callable, chunk: list) -> tuple[list, int]:
+    start = perf_counter_ns()
+    results = [func(item) for item in chunk]
+    return results, perf_counter_ns() - start
+
+
+def _tune(size: int, count: int, elapsed: int) -> int:
+    if elapsed <= 0:
+        return min(size * 2, _MAX_CHUNKSIZE)
+    target = count * _TARGET_CHUNK_NS // elapsed
+    return max(1, min(target, size * 2, _MAX_CHUNKSIZE))
+
+
+@_export
+def pmap(
+    func: Callable[[T], R],
+    iterable: Iterable[T],
+    /,
+    *,
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    ordered: bool = True,
+    max_inflight: Optional[int] = None,
+    processes: bool = False,
+) -> Iterator[R]:
+    """Lazily map `func` over `iterable` on a pool of workers with bounded in-flight work.
+
+    Unlike `concurrent.futures.Executor.map`, items are pulled from `iterable` only as
+    in-flight chunks complete, so at most ``max_inflight * chunksize`` items (and their
+    results) are held in memory at once. The pool is created on first iteration and is
+    shut down (cancelling any pending chunks) when the iterator is exhausted, closed, or
+    garbage collected, or when a worker raises. A worker's exception is re-raised as-is
+    from the iterator.
+
+    Compose with `do` to run a side effect in parallel while passing items through:
+
+        >>> for item in pmap(partial(do, upload), items, workers=8):
+        ...     ...
+
+    Args:
+        func (Callable[[T], R]): function to apply to each item (must be picklable if `processes`)
+        iterable (Iterable[T]): items to map over; consumed lazily
+        workers (Optional[int]): number of pool workers; defaults to ``os.cpu_count()``
+        chunksize (Optional[int]): items per submitted task; if None, it is auto-tuned from
+            the measured per-item latency of completed chunks
+        ordered (bool): yield results in input order if True, else in completion order
+        max_inflight (Optional[int]): maximum number of submitted but unconsumed chunks;
+            defaults to ``2 * workers``
+        processes (bool): use a `ProcessPoolExecutor` instead of a `ThreadPoolExecutor`
+
+    Returns:
+        Iterator[R]: results of `func` applied to each item
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"Expected workers to be positive, not {workers}")
+    if chunksize is not None and chunksize < 1:
+        raise ValueError(f"Expected chunksize to be positive, not {chunksize}")
+    if max_inflight is None:
+        max_inflight = 2 * workers
+    if max_inflight < 1:
+        raise ValueError(f"Expected max_inflight to be positive, not {max_inflight}")
+
+    return _pmap(func, iter(iterable), workers, chunksize, ordered, max_inflight, processes)
+
+
+def _pmap(func, it, workers, chunksize, ordered, max_inflight, processes):
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+    pool_type = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    pool = pool_type(max_workers=workers)
+    inflight = deque()
+    size = chunksize or 1
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(inflight) < max_inflight:
+                chunk = list(islice(it, size))
+                if chunk:
+                    inflight.append(pool.submit(_apply, func, chunk))
+                else:
+                    exhausted = True
+            if not inflight:
+                return
+
+            if ordered:
+                future = inflight.popleft()
+            else:
+                done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+                future = next(iter(done))
+                inflight.remove(future)
+            results, elapsed = future.result()
+
+            if chunksize is None:
+                size = _tune(size, len(results), elapsed)
+            yield from results
+    finally:
+        for future in inflight:
+            future.cancel()
+        pool.shutdown(wait=True, cancel_futures=True)
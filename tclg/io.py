@@ -1,8 +1,15 @@
-from collections.abc import Iterable
+import os
+
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import nullcontext
+from functools import partial
 from io import BufferedIOBase, BytesIO, IOBase, RawIOBase, StringIO, TextIOBase
+from operator import itemgetter
 from os import PathLike
 from pathlib import Path
-from typing import Union, overload
+from typing import Any, AnyStr, Optional, Union, overload
+
+from tclg.contextlib import timed
 
 
 __all__ = []
@@ -23,6 +30,7 @@ def read(file: Union[TextIOBase, PathLike, str], /) -> str:
     ...
 
 @_export
+@timed("tclg.io.read")
 def read(file, /):
     match file:
         case RawIOBase():
@@ -54,6 +62,7 @@ def write(file: Union[PathLike, str], value: str, /) -> int:
     ...
 
 @_export
+@timed("tclg.io.write")
 def write(file, value, /, *, flush=True, close=False):
     if isinstance(file, IOBase):
         try:
@@ -71,7 +80,7 @@ def write(file, value, /, *, flush=True, close=False):
         case bytes():
             return file.write_bytes(value)
         case str():
-            return file.write_str(value)
+            return file.write_text(value)
         case _:
             raise TypeError(f"Expected type of value to be str or bytes, but found that it was {type(value)}")
 
@@ -93,6 +102,7 @@ def append(file: Union[PathLike, str], value: str, /) -> int:
     ...
 
 @_export
+@timed("tclg.io.append")
 def append(file, value, /, *, flush=True, close=False):
     if isinstance(file, IOBase):
         try:
@@ -124,6 +134,7 @@ def readlines(file: Union[TextIOBase, PathLike, str], /) -> list[str]:
     ...
 
 @_export
+@timed("tclg.io.readlines")
 def readlines(file, /):
     if isinstance(file, IOBase):
         return file.readlines()
@@ -149,6 +160,7 @@ def writelines(file: Union[PathLike, str], lines: Iterable[str], /) -> None:
     ...
 
 @_export
+@timed("tclg.io.writelines")
 def writelines(file, lines, /, *, flush=True, close=False):
     if isinstance(file, IOBase):
         try:
@@ -181,6 +193,7 @@ def appendlines(file: Union[PathLike, str], lines: Iterable[str], /) -> None:
     ...
 
 @_export
+@timed("tclg.io.appendlines")
 def appendlines(file, lines, /, *, flush=True, close=False):
     if isinstance(file, IOBase):
         try:
@@ -194,3 +207,277 @@ def appendlines(file, lines, /, *, flush=True, close=False):
 
     with open(file, mode='at') as f:
         f.writelines(lines)
+
+
+# region Records
+
+_BLOCK_SIZE = 1 << 20
+_MAX_RANGE_SIZE = 1 << 22
+
+
+def _open(file, mode):
+    if isinstance(file, IOBase):
+        return nullcontext(file)
+    return open(file, mode)
+
+
+def _blocks(file: IOBase, block_size: int, limit: Optional[int] = None) -> Iterator[AnyStr]:
+    """Yield successive blocks of whole lines (the last possibly unterminated) from `file`."""
+    tail = file.read(0)
+    newline = b"\n" if isinstance(tail, bytes) else "\n"
+    while limit is None or limit > 0:
+        block = file.read(block_size if limit is None else min(block_size, limit))
+        if not block:
+            break
+        if limit is not None:
+            limit -= len(block)
+        cut = block.rfind(newline) + 1
+        if cut:
+            yield tail + block[:cut] if tail else block[:cut]
+            tail = block[cut:]
+        else:
+            tail += block
+    if tail:
+        yield tail
+
+
+def _ranges(path: Union[PathLike, str], range_size: int) -> Iterator[tuple[int, int]]:
+    """Yield ``(start, end)`` byte offsets that partition `path` on line boundaries."""
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        start = 0
+        while start < size:
+            f.seek(start + range_size)
+            f.readline()
+            end = min(f.tell(), size)
+            yield start, end
+            start = end
+
+
+def _read_range(path: Union[PathLike, str], parse: Callable, block_size: int, span: tuple[int, int]) -> list:
+    start, end = span
+    records = []
+    with open(path, "rb") as f:
+        f.seek(start)
+        for block in _blocks(f, block_size, end - start):
+            records.extend(parse(block))
+    return records
+
+
+def _read_records(file, parse: Callable, block_size: int, workers: Optional[int]) -> Iterator:
+    if workers is None:
+        with _open(file, "rb") as f:
+            for block in _blocks(f, block_size):
+                yield from parse(block)
+        return
+
+    from tclg.functools import pmap
+
+    size = os.path.getsize(file)
+    range_size = max(block_size, min(_MAX_RANGE_SIZE, size // (4 * workers)))
+    read_range = partial(_read_range, file, parse, block_size)
+    ranges = _ranges(file, range_size)
+    for records in pmap(read_range, ranges, workers=workers, chunksize=1, max_inflight=workers + 1, processes=True):
+        yield from records
+
+
+def _parse_jsonl(fields: Optional[Sequence[str]], block: AnyStr) -> list:
+    from json import JSONDecoder
+
+    if isinstance(block, bytes):
+        block = block.decode("utf-8")
+    decode = JSONDecoder().decode
+    records = [decode(line) for line in block.split("\n") if line and not line.isspace()]
+    if fields is not None:
+        records = [{k: record[k] for k in fields if k in record} for record in records]
+    return records
+
+
+def _parse_delimited(delimiter: str, fields: Optional[Sequence[int]], encoding: str, block: AnyStr) -> list[list[str]]:
+    if isinstance(block, bytes):
+        block = block.decode(encoding)
+    if "\r" in block:
+        block = block.replace("\r\n", "\n")
+    lines = [line for line in block.split("\n") if line]
+    if fields is None:
+        return [line.split(delimiter) for line in lines]
+
+    # Fields after the last projected one are left unsplit, unless any are counted from the end.
+    maxsplit = max(fields) + 1 if min(fields) >= 0 else -1
+    project = itemgetter(*fields)
+    if len(fields) == 1:
+        return [[project(line.split(delimiter, maxsplit))] for line in lines]
+    return [list(project(line.split(delimiter, maxsplit))) for line in lines]
+
+
+def _check_records_args(file, block_size: int, workers: Optional[int]) -> None:
+    if block_size < 1:
+        raise ValueError(f"Expected block_size to be positive, not {block_size}")
+    if workers is not None:
+        if workers < 1:
+            raise ValueError(f"Expected workers to be positive, not {workers}")
+        if isinstance(file, IOBase):
+            raise TypeError(f"Expected file to be a path when workers is given, not a {type(file)}")
+
+
+@_export
+def read_jsonl(
+    file: Union[IOBase, PathLike, str],
+    /,
+    *,
+    fields: Optional[Sequence[str]] = None,
+    workers: Optional[int] = None,
+    block_size: int = _BLOCK_SIZE,
+) -> Iterator[Any]:
+    """Lazily read the records of a JSON Lines file.
+
+    The file is read in blocks of about `block_size` characters or bytes, each of which is
+    split into lines and parsed at once. Blank lines are skipped.
+
+    Args:
+        file (Union[IOBase, PathLike, str]): path or open binary or text file to read
+        fields (Optional[Sequence[str]]): if given, each record (which must be a JSON object)
+            is projected onto those of these keys that it has; the projection is applied
+            after each record is fully parsed, so it saves memory but costs extra time
+        workers (Optional[int]): if given, `file` (which must be a path) is split into
+            newline-aligned byte ranges that are parsed by this many worker processes; the
+            records are still yielded in file order
+        block_size (int): number of characters or bytes to read at a time
+
+    Returns:
+        Iterator[Any]: the parsed records
+    """
+    _check_records_args(file, block_size, workers)
+    parse = partial(_parse_jsonl, None if fields is None else tuple(fields))
+    return _read_records(file, parse, block_size, workers)
+
+
+@_export
+def read_delimited(
+    file: Union[IOBase, PathLike, str],
+    /,
+    *,
+    delimiter: str = ",",
+    fields: Optional[Sequence[int]] = None,
+    encoding: str = "utf-8",
+    workers: Optional[int] = None,
+    block_size: int = _BLOCK_SIZE,
+) -> Iterator[list[str]]:
+    """Lazily read the rows of a delimited (e.g. comma- or tab-separated) file.
+
+    Rows are split on `delimiter` as-is: quoting and escaping are NOT supported (use `csv`
+    for such files). Otherwise behaves like `read_jsonl`.
+
+    Args:
+        file (Union[IOBase, PathLike, str]): path or open binary or text file to read
+        delimiter (str): string that separates the fields of a row
+        fields (Optional[Sequence[int]]): if given, each row is projected onto the fields at
+            these indexes; unless any index is negative, fields after the last of them are
+            not split
+        encoding (str): encoding with which to decode a path or binary file
+        workers (Optional[int]): see `read_jsonl`
+        block_size (int): number of characters or bytes to read at a time
+
+    Returns:
+        Iterator[list[str]]: the fields of each row
+    """
+    _check_records_args(file, block_size, workers)
+    if fields is not None:
+        fields = tuple(fields)
+        if not fields:
+            raise ValueError("Expected fields to be non-empty")
+    parse = partial(_parse_delimited, delimiter, fields, encoding)
+    return _read_records(file, parse, block_size, workers)
+
+
+def _write_lines(file, lines: Iterable[str], encoding: str, batch_size: int, flush: bool, close: bool) -> int:
+    if batch_size < 1:
+        raise ValueError(f"Expected batch_size to be positive, not {batch_size}")
+
+    def write_batches(f) -> int:
+        text = isinstance(f, TextIOBase)
+        count = 0
+        batch = []
+        for line in lines:
+            batch.append(line)
+            if len(batch) == batch_size:
+                chunk = "\n".join(batch) + "\n"
+                f.write(chunk if text else chunk.encode(encoding))
+                count += len(batch)
+                batch.clear()
+        if batch:
+            chunk = "\n".join(batch) + "\n"
+            f.write(chunk if text else chunk.encode(encoding))
+            count += len(batch)
+        return count
+
+    if isinstance(file, IOBase):
+        try:
+            count = write_batches(file)
+            if flush:
+                file.flush()
+            return count
+        finally:
+            if close:
+                file.close()
+
+    with open(file, mode="wb") as f:
+        return write_batches(f)
+
+
+@_export
+@timed("tclg.io.write_jsonl")
+def write_jsonl(
+    file: Union[IOBase, PathLike, str],
+    records: Iterable[Any],
+    /,
+    *,
+    encoding: str = "utf-8",
+    batch_size: int = 1024,
+    flush: bool = True,
+    close: bool = False,
+) -> int:
+    """Write `records` as compact JSON Lines, `batch_size` records per write.
+
+    Args:
+        file (Union[IOBase, PathLike, str]): path (which is truncated) or open binary or text file
+        records (Iterable[Any]): JSON-serializable records
+        encoding (str): encoding with which to encode to a path or binary file
+        batch_size (int): number of records to encode and join before each write
+        flush (bool): flush an open file afterwards
+        close (bool): close an open file afterwards
+
+    Returns:
+        int: number of records written
+    """
+    from json import JSONEncoder
+
+    encode = JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    return _write_lines(file, map(encode, records), encoding, batch_size, flush, close)
+
+
+@_export
+@timed("tclg.io.write_delimited")
+def write_delimited(
+    file: Union[IOBase, PathLike, str],
+    rows: Iterable[Iterable[Any]],
+    /,
+    *,
+    delimiter: str = ",",
+    encoding: str = "utf-8",
+    batch_size: int = 1024,
+    flush: bool = True,
+    close: bool = False,
+) -> int:
+    """Write `rows` as `delimiter`-separated lines, `batch_size` rows per write.
+
+    Fields are converted with `str` and are NOT quoted or escaped (see `read_delimited`).
+    Otherwise behaves like `write_jsonl`.
+
+    Returns:
+        int: number of rows written
+    """
+    join = delimiter.join
+    return _write_lines(file, (join(map(str, row)) for row in rows), encoding, batch_size, flush, close)
+
+# endregion
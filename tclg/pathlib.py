@@ -1,12 +1,13 @@
 # TODO consider renaming `tclg.pathlib` to `tclg.fsutil` and import it as `fs`
 import os
-import shutil as sh
 
 from collections.abc import Iterator
 from os import PathLike
 from pathlib import Path
 from typing import Optional, Union
 
+from tclg.contextlib import timed
+
 
 __all__ = []
 __dir__ = lambda: __all__
@@ -24,6 +25,7 @@ home = _export(Path.home)
 
 
 @_export
+@timed("tclg.pathlib.chdir")
 def chdir(path: Union[PathLike, str] = None, /) -> Path:
     path = Path.home() if path is None else Path(path)
     os.chdir(path)
@@ -31,6 +33,7 @@ def chdir(path: Union[PathLike, str] = None, /) -> Path:
 
 
 @_export
+@timed("tclg.pathlib.lsdir")
 def lsdir(path: Union[PathLike, str] = None, /) -> list[Path]:
     path = Path() if path is None else Path(path)
     return list(path.iterdir())
@@ -41,6 +44,7 @@ def lsdir(path: Union[PathLike, str] = None, /) -> list[Path]:
 
 
 @_export
+@timed("tclg.pathlib.mkdir")
 def mkdir(
     path: Union[PathLike, str],
     /,
@@ -53,6 +57,8 @@ def mkdir(
     if unlink and (path.is_file() or path.is_symlink()):
         path.unlink()
     elif rmtree and path.is_dir():
+        import shutil as sh
+
         sh.rmtree(path)
 
     kwargs = {"parents": True, "exist_ok": True}
@@ -75,6 +81,7 @@ def mkdir(
 
 
 @_export
+@timed("tclg.pathlib.rmdir")
 def rmdir(path: Union[PathLike, str], /) -> Optional[Path]:
     path = Path(path)
     if path.exists():
@@ -83,6 +90,7 @@ def rmdir(path: Union[PathLike, str], /) -> Optional[Path]:
 
 
 @_export
+@timed("tclg.pathlib.rmdirs")
 def rmdirs(path: Union[PathLike, str], /) -> list[Path]:
     removed = []
     path = Path(path)
@@ -136,6 +144,7 @@ def rmdirs(path: Union[PathLike, str], /) -> list[Path]:
 
 
 @_export
+@timed("tclg.pathlib.rm")
 def rm(path: Union[PathLike, str], /, missing_ok: bool = True) -> None:
     path = Path(path)
     path.unlink(missing_ok=missing_ok)
@@ -169,6 +178,7 @@ def rm(path: Union[PathLike, str], /, missing_ok: bool = True) -> None:
 # region Globs
 
 @_export
+@timed("tclg.pathlib.glob")
 def glob(pattern: str, /, root_dir: Union[PathLike, str] = None) -> list[Path]:
     root_dir = Path() if root_dir is None else Path(root_dir)
     return list(root_dir.glob(pattern))
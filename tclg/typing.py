@@ -1,4 +1,8 @@
-from typing import Protocol, runtime_checkable
+import sys
+
+from collections.abc import Iterable
+from types import WrapperDescriptorType
+from typing import Any, Protocol, TypeVar, runtime_checkable
 
 
 __all__ = []
@@ -10,57 +14,274 @@ def _export(definition):
     return definition
 
 
+T = TypeVar("T")
+
+_MISSING = object()
+
+# protocol -> (member names, whether all members are methods)
+_members: dict[type, tuple[tuple[str, ...], bool]] = {}
+
+# protocol -> id of concrete type -> (result, witness), where the witness pairs each
+# member name that decided the result with the classes to look it up in: the MRO up to
+# the class that defines it for a conforming type, or the whole MRO for the member that a
+# non-conforming type lacks (see `_is_current`)
+_conforms: dict[type, dict[int, tuple[bool, tuple]]] = {}
+
+# ids of concrete types whose `_conforms` entries are discarded when they are collected
+_finalized: set[int] = set()
+
+
+def _protocol_members(proto: type) -> tuple[tuple[str, ...], bool]:
+    try:
+        return _members[proto]
+    except KeyError:
+        pass
+    if not getattr(proto, "_is_protocol", False):
+        raise TypeError(f"Expected proto to be a Protocol, not {proto!r}")
+
+    attrs = proto.__dict__.get("__protocol_attrs__")
+    if attrs is None:
+        from typing import _get_protocol_attrs
+
+        attrs = _get_protocol_attrs(proto)
+    names = tuple(sorted(attrs))
+    methods_only = all(callable(getattr(proto, name, None)) for name in names)
+    members = _members[proto] = (names, methods_only)
+    return members
+
+
+def _lookup(classes: tuple[type, ...], name: str) -> Any:
+    for klass in classes:
+        value = klass.__dict__.get(name, _MISSING)
+        if value is not _MISSING:
+            return value
+    return None
+
+
+def _resolve(cls: type, names: tuple[str, ...]) -> tuple[bool, tuple]:
+    mro = cls.__mro__
+    witness = []
+    for name in names:
+        for i, klass in enumerate(mro):
+            if name in klass.__dict__:
+                break
+        else:
+            return False, ((name, mro),)
+        if klass.__dict__[name] is None:
+            return False, ((name, mro),)
+        witness.append((name, mro[:i + 1]))
+    return True, tuple(witness)
+
+
+def _is_current(entry: tuple[bool, tuple]) -> bool:
+    result, witness = entry
+    for name, classes in witness:
+        if (_lookup(classes, name) is not None) is not result:
+            return False
+    return True
+
+
+if sys.version_info >= (3, 12):
+    # `typing` looks up protocol members with `inspect.getattr_static` since Python 3.12.
+
+    def _is_dynamic(cls: type) -> bool:
+        return False
+
+    def _getattr(obj: Any, name: str) -> Any:
+        from inspect import getattr_static
+
+        return getattr_static(obj, name)
+
+else:
+
+    def _is_dynamic(cls: type) -> bool:
+        # Instances of such types may resolve attributes that their types do not define.
+        for klass in cls.__mro__:
+            namespace = klass.__dict__
+            if "__getattr__" in namespace:
+                return True
+            if "__getattribute__" in namespace:
+                return not isinstance(namespace["__getattribute__"], WrapperDescriptorType)
+        return False
+
+    _getattr = getattr
+
+
+def _forget(cls_id: int) -> None:
+    _finalized.discard(cls_id)
+    for results in _conforms.values():
+        results.pop(cls_id, None)
+
+
+def _check_instance(obj: Any, proto: type, names: tuple[str, ...]) -> bool:
+    for name in names:
+        try:
+            value = _getattr(obj, name)
+        except AttributeError:
+            return False
+        if value is None and callable(getattr(proto, name, None)):
+            return False
+    return True
+
+
+def _check(obj: Any, proto: type) -> bool:
+    names, methods_only = _protocol_members(proto)
+    cls = type(obj)
+    if not methods_only or _is_dynamic(cls):
+        return _check_instance(obj, proto, names)
+
+    entry = _resolve(cls, names)
+    # An instance `__dict__` may supply the members that its type lacks.
+    if not entry[0] and cls.__dictoffset__:
+        return _check_instance(obj, proto, names)
+
+    try:
+        results = _conforms[proto]
+    except KeyError:
+        results = _conforms[proto] = {}
+    cls_id = id(cls)
+    if cls_id not in _finalized:
+        from weakref import finalize
+
+        finalize(cls, _forget, cls_id)
+        _finalized.add(cls_id)
+    results[cls_id] = entry
+    return entry[0]
+
+
+@_export
+def conforms(obj: Any, proto: type) -> bool:
+    """Return whether `obj` structurally conforms to the `Protocol` class `proto`.
+
+    Equivalent to ``isinstance(obj, proto)`` for a `runtime_checkable` protocol, except
+    that `proto` need not be `runtime_checkable`, and that an instance attribute set to
+    None does not hide a method of its type.
+
+    When all of the members of `proto` are methods, the result is cached per concrete
+    type of `obj` (for a non-conforming type, only if its instances have no ``__dict__``).
+    A cached result is used only while the classes that decided it still define (or
+    still lack) the same methods, so adding or deleting methods takes effect immediately.
+    Other objects, protocols with data members, and (before Python 3.12) types that
+    customize attribute lookup with ``__getattr__`` or ``__getattribute__`` are checked
+    against `obj` itself on every call.
+    """
+    try:
+        entry = _conforms[proto][id(type(obj))]
+    except KeyError:
+        return _check(obj, proto)
+    if _is_current(entry):
+        return entry[0]
+    return _check(obj, proto)
+
+
+@_export
+def filter_conforming(objs: Iterable[T], proto: type) -> list[T]:
+    """Return the items of `objs` that structurally conform to `proto` (see `conforms`)."""
+    results = _conforms.get(proto, {})
+    conforming = []
+    for obj in objs:
+        entry = results.get(id(type(obj)))
+        if entry is not None and _is_current(entry):
+            result = entry[0]
+        else:
+            result = _check(obj, proto)
+            results = _conforms.get(proto, results)
+        if result:
+            conforming.append(obj)
+    return conforming
+
+
+@_export
+def invalidate(cls: type = None) -> None:
+    """Discard the cached `conforms` results for `cls`, or for all classes if `cls` is None.
+
+    Only needed to release memory early, since stale results are never used.
+    """
+    if cls is None:
+        _conforms.clear()
+        return
+    for results in _conforms.values():
+        results.pop(id(cls), None)
+
+
+class _CachedProtocolMeta(type(Protocol)):
+    def __instancecheck__(cls, instance) -> bool:
+        if cls.__dict__.get("_is_protocol", False) and getattr(cls, "_is_runtime_protocol", False):
+            return conforms(instance, cls)
+        return super().__instancecheck__(instance)
+
+    def __setattr__(cls, name, value) -> None:
+        super().__setattr__(name, value)
+        _members.pop(cls, None)
+        _conforms.pop(cls, None)
+
+    def __delattr__(cls, name) -> None:
+        super().__delattr__(name)
+        _members.pop(cls, None)
+        _conforms.pop(cls, None)
+
+
+@_export
+class CachedProtocol(Protocol, metaclass=_CachedProtocolMeta):
+    """Base class for protocols whose `isinstance` checks are cached per concrete type.
+
+    Subclass it alongside `Protocol` in place of `Protocol` alone, e.g.
+    ``class SupportsClose(CachedProtocol, Protocol)``. Runtime checks against the
+    subclass then go through `conforms`.
+    """
+
+
 @runtime_checkable
 @_export
-class Exitable(Protocol):
+class Exitable(CachedProtocol, Protocol):
     def exit(self):
         ...
 
 
 @runtime_checkable
 @_export
-class SupportsDelAttr(Protocol):
+class SupportsDelAttr(CachedProtocol, Protocol):
     def __delattr__(self, key):
         ...
 
 
 @runtime_checkable
 @_export
-class SupportsDelItem(Protocol):
+class SupportsDelItem(CachedProtocol, Protocol):
     def __delitem__(self, key):
         ...
 
 
 @runtime_checkable
 @_export
-class SupportsGetAttr(Protocol):
+class SupportsGetAttr(CachedProtocol, Protocol):
     def __getattr__(self, name):
         ...
 
 
 @runtime_checkable
 @_export
-class SupportsGetAttribute(Protocol):
+class SupportsGetAttribute(CachedProtocol, Protocol):
     def __getattribute__(self, name):
         ...
 
 
 @runtime_checkable
 @_export
-class SupportsGetItem(Protocol):
+class SupportsGetItem(CachedProtocol, Protocol):
     def __getitem__(self, key):
         ...
 
 
 @runtime_checkable
 @_export
-class SupportsSetAttr(Protocol):
+class SupportsSetAttr(CachedProtocol, Protocol):
     def __setattr__(self, name, value):
         ...
 
 
 @runtime_checkable
 @_export
-class SupportsSetItem(Protocol):
+class SupportsSetItem(CachedProtocol, Protocol):
     def __setitem__(self, key, value):
         ...
@@ -0,0 +1,31 @@
+import pytest
+
+from tclg.collections import AttrsItemsView, MutableAttrsItemsView
+
+
+def test_attrs_items_view():
+    view = AttrsItemsView({"a": 1, "_b": 2})
+    assert view.a == 1
+    assert dir(view) == ["a"]
+    with pytest.raises(AttributeError):
+        view._b
+    with pytest.raises(AttributeError):
+        view.c
+    with pytest.raises(TypeError):
+        view.a = 3
+
+
+def test_mutable_attrs_items_view():
+    data = {"a": 1}
+    view = MutableAttrsItemsView(data)
+    view.b = 2
+    del view.a
+    assert data == {"b": 2}
+    with pytest.raises(AttributeError):
+        view._c = 3
+
+
+@pytest.mark.parametrize("cls", [AttrsItemsView, MutableAttrsItemsView])
+def test_attrs_items_view_rejects_non_mapping(cls):
+    with pytest.raises(TypeError):
+        cls([("a", 1)])
@@ -0,0 +1,136 @@
+import asyncio
+import threading
+
+import pytest
+
+from tclg import contextlib
+from tclg.contextlib import breakable, catch, exitable, timed
+
+
+@pytest.fixture
+def timing():
+    timed.reset()
+    timed.enable()
+    yield
+    timed.disable()
+    timed.reset()
+
+
+def test_timed_retires_exited_threads(timing):
+    def work():
+        with timed("work"):
+            pass
+
+    registered = len(contextlib._timed_registry)
+    for _ in range(50):
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+
+    assert len(contextlib._timed_registry) == registered
+    assert timed.snapshot()["work"]["count"] == 50
+
+
+def test_timed_recursion_shares_path(timing):
+    @timed("fib")
+    def fib(n):
+        return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+    with timed("outer"):
+        fib(10)
+
+    assert list(timed.snapshot()) == ["outer", "outer/fib"]
+
+
+
+def test_timed_asyncio_tasks_do_not_nest(timing):
+    async def task(name):
+        with timed(name):
+            await asyncio.sleep(0)
+
+    async def main():
+        await asyncio.gather(task("task1"), task("task2"))
+
+    asyncio.run(main())
+    with timed("after"):
+        pass
+
+    assert list(timed.snapshot()) == ["after", "task1", "task2"]
+
+
+def test_timed_suspended_generator(timing):
+    def numbers():
+        with timed("gen"):
+            yield 1
+            yield 2
+
+    with timed("outer"):
+        it = numbers()
+        next(it)
+    with timed("while_suspended"):
+        pass
+    it.close()
+    with timed("after"):
+        pass
+
+    snapshot = timed.snapshot()
+    assert snapshot["outer"]["count"] == 1
+    assert snapshot["outer/gen"]["count"] == 1
+    assert "after" in snapshot
+
+
+def test_timed_nested_entry_while_disabled(timing):
+    span = timed("span")
+    with span:
+        timed.disable()
+        with span:
+            pass
+        timed.enable()
+        with timed("inner"):
+            pass
+
+    assert list(timed.snapshot()) == ["span", "span/inner"]
+
+
+def test_timed_to_prometheus(timing):
+    contextlib._timed_record("a\n\"b\"", 1234567890000000)
+    text = timed.to_prometheus()
+
+    assert 'span="a\\n\\"b\\""' in text
+    assert "_sum{" in text and " 1234567.89\n" in text
+    assert 'le="2251799.813685248"' in text
+
+
+@pytest.mark.parametrize(
+    "signal",
+    [
+        lambda block, loop: block.exit(),
+        lambda block, loop: loop.break_(),
+        lambda block, loop: loop.continue_(),
+    ],
+    ids=["exit", "break_", "continue_"],
+)
+def test_control_flow_does_not_pin_handled_exceptions(signal):
+    block = exitable()
+    loop = breakable([None])
+    with block:
+        for _ in loop:
+            with loop:
+                try:
+                    1 / 0
+                except ZeroDivisionError:
+                    signal(block, loop)
+
+    for value in (*vars(block).values(), *vars(loop).values()):
+        if isinstance(value, BaseException):
+            assert value.__context__ is None and value.__traceback__ is None
+
+
+def test_catch_matches_types():
+    with catch(KeyError, ValueError) as caught:
+        raise ValueError
+    assert isinstance(caught.value, ValueError)
+
+    with pytest.raises(TypeError):
+        with catch(KeyError):
+            raise TypeError
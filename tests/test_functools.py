@@ -0,0 +1,81 @@
+import threading
+from functools import partial
+from itertools import count
+
+import pytest
+
+from tclg.functools import do, pmap
+
+
+def double(x):
+    return 2 * x
+
+
+@pytest.mark.parametrize("chunksize", [None, 1, 7])
+def test_pmap_ordered(chunksize):
+    assert list(pmap(double, range(1000), workers=4, chunksize=chunksize)) == [2 * x for x in range(1000)]
+
+
+def test_pmap_unordered():
+    results = list(pmap(double, range(1000), workers=4, chunksize=3, ordered=False))
+    assert sorted(results) == [2 * x for x in range(1000)]
+
+
+def test_pmap_pulls_lazily():
+    pulled = []
+
+    def items():
+        for x in count():
+            pulled.append(x)
+            yield x
+
+    it = pmap(double, items(), workers=2, chunksize=3, max_inflight=2)
+    assert next(it) == 0
+    assert len(pulled) <= 2 * 3
+    it.close()
+
+
+def test_pmap_reraises():
+    error = KeyError("boom")
+
+    def func(x):
+        if x == 5:
+            raise error
+        return x
+
+    with pytest.raises(KeyError) as excinfo:
+        list(pmap(func, range(10), workers=2, chunksize=1))
+    assert excinfo.value is error
+
+
+def test_pmap_close_cancels_pending():
+    processed = []
+    gate = threading.Event()
+
+    def func(x):
+        processed.append(x)
+        if x == 1:
+            gate.wait()
+        return x
+
+    it = pmap(func, range(100), workers=1, chunksize=1, max_inflight=4)
+    assert next(it) == 0
+    threading.Timer(0.05, gate.set).start()
+    it.close()
+    assert processed == [0, 1]
+
+
+def test_pmap_processes():
+    assert list(pmap(abs, range(-50, 50), workers=2, processes=True)) == [abs(x) for x in range(-50, 50)]
+
+
+def test_pmap_do():
+    seen = []
+    assert list(pmap(partial(do, seen.append), range(100), workers=4)) == list(range(100))
+    assert sorted(seen) == list(range(100))
+
+
+@pytest.mark.parametrize("kwargs", [{"workers": 0}, {"chunksize": 0}, {"max_inflight": 0}], ids=str)
+def test_pmap_invalid(kwargs):
+    with pytest.raises(ValueError):
+        pmap(double, range(10), **kwargs)
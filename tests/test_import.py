@@ -0,0 +1,87 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import tclg
+
+
+SUBMODULES = [
+    "tclg.collections",
+    "tclg.contextlib",
+    "tclg.functools",
+    "tclg.io",
+    "tclg.operator",
+    "tclg.pathlib",
+    "tclg.typing",
+]
+
+# modules that importing any part of `tclg` must not import eagerly
+DEFERRED = ("concurrent.futures", "json", "multiprocessing", "shutil", "threading", "weakref")
+
+# the stdlib modules that `tclg` itself builds on, whose import time is the reference
+REFERENCE = "typing, pathlib, collections.abc"
+
+# budget for each target, as a multiple of the reference import time
+BUDGETS = {"tclg": 0.1, **{name: 2.5 for name in SUBMODULES}}
+
+RUNS = 5
+
+PROGRAM = """
+import sys, time
+before = set(sys.modules)
+start = time.perf_counter_ns()
+import {target}
+elapsed = time.perf_counter_ns() - start
+print(elapsed)
+print(" ".join(sorted(set(sys.modules) - before)))
+"""
+
+
+def import_in_subprocess(target: str) -> tuple[int, set[str]]:
+    """Return the nanoseconds that importing `target` took in a fresh interpreter, and the modules it imported."""
+    # `site` may import the reference modules at startup, so skip it and import `tclg` from its parent directory;
+    # and let bytecode be cached, so that only the first of several runs is charged for compiling `tclg`
+    env = {name: value for name, value in os.environ.items() if name != "PYTHONDONTWRITEBYTECODE"}
+    proc = subprocess.run(
+        [sys.executable, "-S", "-c", PROGRAM.format(target=target)],
+        capture_output=True,
+        cwd=Path(tclg.__file__).parents[1],
+        env=env,
+        check=True,
+        text=True,
+    )
+    elapsed, modules = proc.stdout.splitlines()
+    return int(elapsed), set(modules.split())
+
+
+def best_import_time(target: str) -> int:
+    return min(import_in_subprocess(target)[0] for _ in range(RUNS))
+
+
+@pytest.fixture(scope="module")
+def reference_ns():
+    return best_import_time(REFERENCE)
+
+
+@pytest.mark.parametrize("target", ["tclg", *SUBMODULES])
+def test_no_eager_imports(target):
+    _, modules = import_in_subprocess(target)
+    assert not modules.intersection(DEFERRED)
+
+
+def test_package_does_not_import_submodules():
+    _, modules = import_in_subprocess("tclg")
+    assert not modules.intersection(SUBMODULES)
+
+
+@pytest.mark.parametrize("target", BUDGETS)
+def test_import_time_budget(target, reference_ns):
+    budget = BUDGETS[target] * reference_ns
+    elapsed = best_import_time(target)
+    assert elapsed <= budget, (
+        f"importing {target} took {elapsed / 1e6:.2f} ms, over its budget of "
+        f"{BUDGETS[target]}x the {reference_ns / 1e6:.2f} ms it takes to import {REFERENCE}"
+    )
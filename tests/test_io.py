@@ -0,0 +1,64 @@
+from io import BytesIO, StringIO
+
+import pytest
+
+from tclg.io import read_delimited, read_jsonl, write, write_delimited, write_jsonl
+
+
+ROWS = [[str(i), "a", f"{i}.5", "tail"] for i in range(100)]
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "rows.csv"
+    write_delimited(path, ROWS)
+    return path
+
+
+def test_write_path(tmp_path):
+    path = tmp_path / "out.txt"
+    assert write(path, "é x") == 3
+    assert path.read_text() == "é x"
+    assert write(str(path), b"y") == 1
+    assert path.read_bytes() == b"y"
+
+
+@pytest.mark.parametrize("block_size", [7, 1 << 20])
+def test_read_delimited(csv_path, block_size):
+    assert list(read_delimited(csv_path, block_size=block_size)) == ROWS
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [[0], [2, 0], [-1], [-1, 0], [1, -2]],
+    ids=str,
+)
+def test_read_delimited_fields(csv_path, fields):
+    expected = [[row[i] for i in fields] for row in ROWS]
+    assert list(read_delimited(csv_path, fields=fields, block_size=11)) == expected
+
+
+def test_read_delimited_crlf():
+    assert list(read_delimited(BytesIO(b"a,b\r\nc,d"), fields=[-1])) == [["b"], ["d"]]
+    assert list(read_delimited(StringIO("a,b\r\nc,d\r\n"))) == [["a", "b"], ["c", "d"]]
+
+
+def test_read_delimited_blank_lines():
+    assert list(read_delimited(BytesIO(b"a,b\n\nc,d\n\n"), fields=[1])) == [["b"], ["d"]]
+    assert list(read_delimited(StringIO("\na,b\r\n\r\nc,d"))) == [["a", "b"], ["c", "d"]]
+
+
+def test_read_delimited_workers(csv_path):
+    assert list(read_delimited(csv_path, workers=2, block_size=64)) == ROWS
+
+
+def test_jsonl_roundtrip(tmp_path):
+    records = [{"id": i, "text": "é x", "tags": ["a"]} for i in range(100)]
+    path = tmp_path / "records.jsonl"
+    assert write_jsonl(path, records, batch_size=7) == len(records)
+
+    assert list(read_jsonl(path, block_size=13)) == records
+    with path.open(encoding="utf-8") as f:
+        assert list(read_jsonl(f, block_size=13)) == records
+    assert list(read_jsonl(path, fields=["id", "missing"])) == [{"id": r["id"]} for r in records]
+    assert list(read_jsonl(path, workers=2, block_size=64)) == records
@@ -0,0 +1,150 @@
+import sys
+
+from types import SimpleNamespace
+from typing import Protocol, runtime_checkable
+
+import pytest
+
+from tclg.contextlib import exitable
+from tclg.typing import (
+    CachedProtocol,
+    Exitable,
+    SupportsDelAttr,
+    SupportsDelItem,
+    SupportsGetAttr,
+    SupportsGetAttribute,
+    SupportsGetItem,
+    SupportsSetAttr,
+    SupportsSetItem,
+    conforms,
+    filter_conforming,
+)
+
+
+PROTOCOLS = [
+    Exitable,
+    SupportsDelAttr,
+    SupportsDelItem,
+    SupportsGetAttr,
+    SupportsGetAttribute,
+    SupportsGetItem,
+    SupportsSetAttr,
+    SupportsSetItem,
+]
+
+
+class ExitInInit:
+    def __init__(self):
+        self.exit = print
+
+
+class ExitIsNone:
+    exit = None
+    __setattr__ = None
+
+
+class ExitViaGetAttr:
+    def __getattr__(self, name):
+        return print
+
+
+class ExitSlots:
+    __slots__ = ()
+
+
+OBJECTS = [
+    1,
+    "",
+    {},
+    [],
+    object(),
+    int,
+    sys,
+    exitable(),
+    SimpleNamespace(exit=print),
+    ExitInInit(),
+    ExitIsNone(),
+    ExitViaGetAttr(),
+    ExitSlots(),
+]
+
+
+def typing_isinstance(obj, proto):
+    return type(Protocol).__instancecheck__(proto, obj)
+
+
+@pytest.mark.parametrize("proto", PROTOCOLS, ids=lambda p: p.__name__)
+@pytest.mark.parametrize("obj", OBJECTS, ids=repr)
+def test_matches_typing(obj, proto):
+    expected = typing_isinstance(obj, proto)
+    for _ in range(2):  # uncached, then cached
+        assert conforms(obj, proto) is expected
+        assert isinstance(obj, proto) is expected
+        assert filter_conforming([obj], proto) == ([obj] if expected else [])
+
+
+def test_instance_attributes_conform():
+    assert isinstance(sys, Exitable)
+    assert isinstance(SimpleNamespace(exit=print), Exitable)
+    assert isinstance(ExitInInit(), Exitable)
+
+
+def test_adding_method_after_negative_result():
+    class E:
+        __slots__ = ()
+
+    assert not isinstance(E(), Exitable)
+    E.exit = lambda self: None
+    assert isinstance(E(), Exitable)
+
+
+def test_deleting_method_after_positive_result():
+    class Base:
+        def exit(self):
+            pass
+
+    class E(Base):
+        pass
+
+    assert isinstance(E(), Exitable)
+    del Base.exit
+    assert not isinstance(E(), Exitable)
+    E.exit = None
+    assert not isinstance(E(), Exitable)
+    E.exit = lambda self: None
+    assert isinstance(E(), Exitable)
+
+
+def test_shadowing_method_with_none_after_positive_result():
+    class Base:
+        def exit(self):
+            pass
+
+    class E(Base):
+        __slots__ = ()
+
+    assert isinstance(E(), Exitable)
+    E.exit = None
+    assert not isinstance(E(), Exitable)
+
+
+def test_mutating_protocol():
+    @runtime_checkable
+    class Closeable(CachedProtocol, Protocol):
+        def close(self):
+            ...
+
+    class C:
+        __slots__ = ()
+
+        def close(self):
+            pass
+
+    assert isinstance(C(), Closeable)
+    Closeable.close = None
+    assert conforms(C(), Closeable) is typing_isinstance(C(), Closeable)
+
+
+def test_rejects_non_protocol():
+    with pytest.raises(TypeError):
+        conforms(1, int)